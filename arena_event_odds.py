@@ -4,80 +4,433 @@ Calculations using formulae from Channel Fireball
 https://strategy.channelfireball.com/all-strategy/mtg/channelmagic-articles/whats-the-best-mtg-arena-event-for-expected-value-and-can-you-go-infinite/
 """
 from pprint import pprint
-from functools import partial
+from functools import partial, lru_cache, wraps
+from math import fsum
+from operator import mul
 pp = partial(pprint, sort_dicts=False)
-from math import factorial
+import numpy as np
+from numpy.polynomial import polynomial as P
 from tabulate import tabulate
-
-pct = lambda x: round(x*100, ndigits=1)
+try:
+    from numba import njit, prange
+    HAVE_NUMBA = True
+except ImportError:  # Numba is optional; see the kernel fallbacks below
+    HAVE_NUMBA = False
+    def njit(**options):
+        return lambda func: func
+    prange = range
+
+def pct(x):
+    return round(x*100, 1)
+
+def _binomial(n, k):
+    """n choose k by the multiplicative formula, in exact integer arithmetic."""
+    k = min(k, n-k)
+    num = den = 1
+    for i in range(1, k+1):
+        num *= n - k + i
+        den *= i
+    return num // den
+
+# Binomial coefficients for every n used in this module (n <= 9),
+# built once at import time: _BINOM[n][k] == n choose k.
+_BINOM_MAXN = 9
+_BINOM = [[_binomial(n, k) for k in range(n + 1)] for n in range(_BINOM_MAXN + 1)]
 
 def binomial(n, k):
-    return factorial(n) / (factorial(k) * factorial(n-k))
+    """n choose k, looked up from the precomputed table where possible.
+
+    Neither this nor the table needs `math.factorial`.  Compiled kernels,
+    which cannot call it, index the `_BINOM_N2` tuple instead.
+
+    >>> binomial(9, 2)
+    36
+    >>> binomial(20, 10)
+    184756
+    """
+    if n <= _BINOM_MAXN:
+        return _BINOM[n][k]
+    return _binomial(n, k)
+
+# (numwins+2 choose 2) for each possible win count in a three-loss event.
+# A tuple rather than a table row so that the compiled kernels can index it.
+_BINOM_N2 = tuple(_BINOM[n+2][2] for n in range(8))
+
+def _record_prob_lose3(winrate, numwins):
+    """Body of `cf_record_prob_lose3`: plain arithmetic, for floats or arrays."""
+    c = 1-winrate
+    if numwins == 7:
+        return pow(winrate, 7) * (1 + 7*c + 28*c*c)
+    else:
+        return pow(winrate, numwins) * c*c * _BINOM_N2[numwins] * c
+
+def _record_prob_lose2(winrate, numwins, maxwins):
+    """Body of `cf_record_prob_lose2`, as for `_record_prob_lose3`."""
+    c = 1-winrate
+    if numwins == maxwins:
+        return pow(winrate, numwins) * (1 + numwins*c)
+    else:
+        return pow(winrate, numwins)*c*c*(numwins+1)
+
+# The same arithmetic, compiled for float winrates.
+_record_prob_lose3_kernel = njit(cache=True)(_record_prob_lose3)
+_record_prob_lose2_kernel = njit(cache=True)(_record_prob_lose2)
 
 def cf_record_prob_lose3(winrate, numwins):
     """Probability of winning `numwins` game in an event that stops at three losses.
 
-    Assumes max wins is 7.
+    Assumes max wins is 7.  `winrate` may also be an array.
 
     >>> pct(cf_record_prob_lose3(0.6, 7))
     23.2
     >>> pct(cf_record_prob_lose3(0.45, 4))
     10.2
+    >>> cf_record_prob_lose3(np.array([0.5, 0.6]), 3).round(3)
+    array([0.156, 0.138])
+    >>> cf_record_prob_lose3(0.5, -1)
+    Traceback (most recent call last):
+    ...
+    ValueError: numwins must be between 0 and 7, not -1
     """
-    if numwins == 7:
-        return pow(winrate, 7) + 7*pow(winrate, 6)*(1-winrate)*winrate + 28*pow(winrate, 6)*pow(1-winrate, 2)*winrate
-    else:
-        return pow(winrate, numwins) * pow(1-winrate, 2) * binomial(numwins+2, 2) * (1-winrate)
+    if not 0 <= numwins <= 7:
+        raise ValueError(f"numwins must be between 0 and 7, not {numwins!r}")
+    if isinstance(winrate, float):
+        return _record_prob_lose3_kernel(winrate, numwins)
+    return _record_prob_lose3(winrate, numwins)
 
 def cf_record_prob_lose2(winrate, numwins, maxwins=5):
     """Probability of winning `numwins` game in an event that stops at two losses.
 
+    `winrate` may also be an array, as for `cf_record_prob_lose3`.
+
     >>> pct(cf_record_prob_lose2(0.6, 5))
     23.3
     >>> pct(cf_record_prob_lose2(0.45, 3))
     11.0
     """
-    if numwins == maxwins:
-        return pow(winrate, numwins) + numwins*pow(winrate, numwins)*(1-winrate)
-    else:
-        return pow(winrate, numwins)*pow(1-winrate, 2)*(numwins+1)
+    if isinstance(winrate, float):
+        return _record_prob_lose2_kernel(winrate, numwins, maxwins)
+    return _record_prob_lose2(winrate, numwins, maxwins)
+
+def _neg_binom_vec(winrate, losses, maxwins):
+    """Odds of ending an event on each of 0-`maxwins` wins.
+
+    The event stops at `losses` losses or at `maxwins` wins.  Odds of
+    stopping short of `maxwins` follow the negative binomial recurrence
+        p[k] = p[k-1] * w * (k+losses-1) / k
+    and the final entry collects every way of reaching `maxwins` wins,
+    built up the same way over the number of losses taken along the way.
+
+    >>> round(float(_neg_binom_vec(0.6, 3, 7).sum()), 12)
+    1.0
+    """
+    w = np.asarray(winrate, dtype=np.float64)
+    c = 1-w
+    odds = np.empty(w.shape + (maxwins+1,))
+    odds[..., 0] = c**losses
+    for k in range(1, maxwins):
+        odds[..., k] = odds[..., k-1] * w * (k+losses-1) / k
+    term = w**maxwins
+    odds[..., maxwins] = term
+    for j in range(1, losses):
+        term = term * c * (maxwins+j-1) / j
+        odds[..., maxwins] += term
+    return odds
+
+def lose3_odds(winrate):
+    """Odds of winning each of 0-7 games in an event that stops at three losses.
+
+    Vectorized equivalent of `cf_record_prob_lose3` over all win counts.
+    `winrate` may also be an array, in which case the last axis of the result
+    indexes win counts.
+
+    >>> [pct(p) for p in lose3_odds(0.6)] == [pct(cf_record_prob_lose3(0.6, n)) for n in range(8)]
+    True
+    """
+    return _neg_binom_vec(winrate, 3, 7)
+
+def lose2_odds(winrate, maxwins=5):
+    """Odds of winning each of 0-`maxwins` games in an event that stops at two losses.
+
+    Vectorized equivalent of `cf_record_prob_lose2` over all win counts.
+    `winrate` may also be an array, as for `lose3_odds`.
+
+    >>> [pct(p) for p in lose2_odds(0.45, 4)] == [pct(cf_record_prob_lose2(0.45, n, 4)) for n in range(5)]
+    True
+    """
+    return _neg_binom_vec(winrate, 2, maxwins)
+
+# Polynomials in the winrate w, as coefficient arrays with lowest order first.
+_WIN = np.array([0.0, 1.0])
+_LOSS = np.array([1.0, -1.0])
+
+def _odds_polys(polys):
+    """Stacks per-wincount odds polynomials into one zero-padded 2-D array."""
+    odds = np.zeros((len(polys), max(len(p) for p in polys)))
+    for numwins, poly in enumerate(polys):
+        odds[numwins, :len(poly)] = poly
+    return odds
+
+def lose2_odds_polys(maxwins=5):
+    """`lose2_odds` as polynomials in the winrate: row n holds the coefficients for n wins."""
+    return _odds_polys(
+        [(k+1) * P.polymul(P.polypow(_WIN, k), P.polypow(_LOSS, 2)) for k in range(maxwins)]
+        + [P.polymul(P.polypow(_WIN, maxwins), P.polyadd([1], maxwins*_LOSS))])
+
+@njit(cache=True)
+def _average_lose3(w, rewards):
+    """Average reward at winrate `w` in an event that stops at three losses.
+
+    Powers of the winrate are built up by one multiplication per win count
+    rather than recomputed by `cf_record_prob_lose3` for each, and powers of
+    the loss rate are computed once.
+    """
+    c = 1-w
+    c2 = c*c
+    c3 = c2*c
+    w_pow = 1.0
+    average = 0.0
+    for numwins in range(7):
+        average += w_pow * c3 * _BINOM_N2[numwins] * rewards[numwins]
+        w_pow *= w
+    average += w_pow * (1 + 7*c + 28*c2) * rewards[7]
+    return average
+
+@njit(cache=True, parallel=True)
+def _sweep_lose3(winrates, rewards):
+    """`_average_lose3` for each of `winrates`, in parallel."""
+    averages = np.empty(winrates.shape[0])
+    for i in prange(winrates.shape[0]):
+        averages[i] = _average_lose3(winrates[i], rewards)
+    return averages
+
+@njit(cache=True)
+def _roi_lose3(w, gems, packs):
+    """Average gems, packs and wins at winrate `w` in a three-loss event.
+
+    One pass over the win counts serves all three.  Each average is summed
+    exactly as `_average_lose3` would sum it on its own.
+    """
+    c = 1-w
+    c2 = c*c
+    c3 = c2*c
+    w_pow = 1.0
+    avg_gems = avg_packs = avg_wins = 0.0
+    for numwins in range(7):
+        odds = w_pow * c3 * _BINOM_N2[numwins]
+        avg_gems += odds * gems[numwins]
+        avg_packs += odds * packs[numwins]
+        avg_wins += odds * numwins
+        w_pow *= w
+    odds = w_pow * (1 + 7*c + 28*c2)
+    return avg_gems + odds*gems[7], avg_packs + odds*packs[7], avg_wins + odds*7
+
+@njit(cache=True, parallel=True)
+def _sweep_roi_lose3(winrates, gems, packs):
+    """`_roi_lose3` for each of `winrates`, in parallel, as three arrays."""
+    avg_gems = np.empty(winrates.shape[0])
+    avg_packs = np.empty(winrates.shape[0])
+    avg_wins = np.empty(winrates.shape[0])
+    for i in prange(winrates.shape[0]):
+        avg_gems[i], avg_packs[i], avg_wins[i] = _roi_lose3(winrates[i], gems, packs)
+    return avg_gems, avg_packs, avg_wins
+
+@njit(cache=True)
+def _trad_draft_odds(w):
+    """`TradDraft.wincount_odds` at the float winrate `w`, as a tuple.
+
+    The cubes go through `pow` with a float exponent.  Compiled, that is the
+    same C library call Python makes; repeated multiplication and NumPy's
+    power both round differently in the last bit.
+    """
+    c = 1-w
+    return pow(c, 3.0), 3*(c*c)*w, 3*c*(w*w), pow(w, 3.0)
+
+@njit(cache=True)
+def _average_trad_draft(w, rewards):
+    """Average reward at winrate `w` over Traditional Draft's three matches.
+
+    Gems alone reduce to 3000 w^2, but evaluated that way the double nearest
+    0.95 lands exactly on 2707.5.  Summing the odds term by term gives
+    2707.4999..., the 2707 in the `TradDraft` table, so that is what this does.
+    """
+    odds = _trad_draft_odds(w)
+    return odds[0]*rewards[0] + odds[1]*rewards[1] + odds[2]*rewards[2] + odds[3]*rewards[3]
+
+@njit(cache=True, parallel=True)
+def _sweep_trad_draft(winrates, rewards):
+    """`_average_trad_draft` for each of `winrates`, in parallel."""
+    averages = np.empty(winrates.shape[0])
+    for i in prange(winrates.shape[0]):
+        averages[i] = _average_trad_draft(winrates[i], rewards)
+    return averages
+
+@njit(cache=True)
+def _roi_trad_draft(w, gems, packs):
+    """Average gems, packs and wins at winrate `w`, as for `_roi_lose3`."""
+    odds = _trad_draft_odds(w)
+    return (odds[0]*gems[0] + odds[1]*gems[1] + odds[2]*gems[2] + odds[3]*gems[3],
+            odds[0]*packs[0] + odds[1]*packs[1] + odds[2]*packs[2] + odds[3]*packs[3],
+            odds[1] + 2*odds[2] + 3*odds[3])
+
+@njit(cache=True, parallel=True)
+def _sweep_roi_trad_draft(winrates, gems, packs):
+    """`_roi_trad_draft` for each of `winrates`, as for `_sweep_roi_lose3`."""
+    avg_gems = np.empty(winrates.shape[0])
+    avg_packs = np.empty(winrates.shape[0])
+    avg_wins = np.empty(winrates.shape[0])
+    for i in prange(winrates.shape[0]):
+        avg_gems[i], avg_packs[i], avg_wins[i] = _roi_trad_draft(winrates[i], gems, packs)
+    return avg_gems, avg_packs, avg_wins
+
+@njit(cache=True)
+def _horner(x, coeffs):
+    """Evaluates the polynomial `coeffs` (lowest order first) at `x`."""
+    result = 0.0
+    for i in range(coeffs.shape[0]-1, -1, -1):
+        result = result*x + coeffs[i]
+    return result
+
+@njit(cache=True, parallel=True)
+def _sweep_horner(xs, coeffs):
+    """`_horner` for each of `xs`, in parallel."""
+    results = np.empty(xs.shape[0])
+    for i in prange(xs.shape[0]):
+        results[i] = _horner(xs[i], coeffs)
+    return results
+
+if not HAVE_NUMBA:
+    # Uncompiled, the sweeps above are Python loops over every winrate.  The
+    # three-loss kernels are plain arithmetic, so NumPy runs them on whole
+    # arrays of winrates instead, with the same result for each element.
+    _sweep_lose3 = _average_lose3
+    _sweep_roi_lose3 = _roi_lose3
+
+    # NumPy's power is not the C library's, so these cubes stay scalar.
+    def _sweep_trad_draft(winrates, rewards):
+        return np.fromiter((_average_trad_draft(w, rewards) for w in winrates.tolist()),
+                           dtype=np.float64, count=winrates.shape[0])
+
+    def _sweep_roi_trad_draft(winrates, gems, packs):
+        averages = [_roi_trad_draft(w, gems, packs) for w in winrates.tolist()]
+        return np.array(averages, dtype=np.float64).reshape(-1, 3).T
+
+    def _sweep_horner(xs, coeffs):
+        return P.polyval(xs, coeffs)
+
+def _cache_scalar_winrates(maxsize=256):
+    """Like `lru_cache`, for functions whose last argument is a winrate.
+
+    Only scalar winrates passed positionally are cached.  Arrays of them,
+    0-d ones included, are unhashable and rarely repeated, and keyword calls
+    are rare, so both are passed straight through.
+    """
+    def decorator(func):
+        cached = lru_cache(maxsize=maxsize)(func)
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            winrate = args[-1] if args and not kwargs else None
+            # Floats first: `np.ndim` costs more than a cache hit.
+            if isinstance(winrate, float) or (
+                    winrate is not None and not isinstance(winrate, np.ndarray)
+                    and np.ndim(winrate) == 0):
+                return cached(*args)
+            return func(*args, **kwargs)
+        wrapper.cache_info = cached.cache_info
+        wrapper.cache_clear = cached.cache_clear
+        return wrapper
+    return decorator
+
+def _sweep(average, sweep, winrate, *args):
+    """Average reward at `winrate`, which may be a float or an array of them.
+
+    Scalars call the `average` kernel directly; arrays go through `sweep`.
+    Floats are checked first, since `np.ndim` costs more than the kernel.
+    """
+    if isinstance(winrate, float) or np.ndim(winrate) == 0:
+        return float(average(float(winrate), *args))
+    winrates = np.asarray(winrate, dtype=np.float64)
+    return sweep(winrates.reshape(-1), *args).reshape(winrates.shape)
 
 def tabulate_roi(roi, winrates):
     """Tabulates ROI data for various winrates.  Used in doctests.
 
     `roi` is the roi method to be called
     `winrates` is a list of winrates as floats.
+
+    If `roi` is an `Event` method, all winrates are evaluated in one batch
+    by `Event.roi_table` and only rounded here, for display.  Whole-number
+    columns are rounded in bulk; `np.round` to a number of digits can differ
+    from `round` on ties, so those columns are rounded the way `roi` does.
     """
-    data = [roi(winrate) for winrate in winrates]
-    column_headers = data[0].keys()
-    data = [c.values() for c in data]
-    data = [ [winrate] + list(row) for winrate, row in zip(winrates, data) ]
-    return tabulate(data, headers=[''] + list(column_headers))
+    event = getattr(roi, '__self__', None)
+    if isinstance(event, type) and issubclass(event, Event):
+        columns = [np.rint(column).astype(int).tolist() if digits is None
+                   else [round(value, digits) for value in column.tolist()]
+                   for column, digits in zip(event.roi_table(winrates).T, ROI_DIGITS)]
+        column_headers = ROI_COLUMNS
+        rows = zip(*columns)
+    else:
+        data = [roi(winrate) for winrate in winrates]
+        column_headers = data[0].keys()
+        rows = (c.values() for c in data)
+    data = [[winrate, *row] for winrate, row in zip(winrates, rows)]
+    return tabulate(data, headers=['', *column_headers])
+
+# Columns of `Event.roi_table`, and the digits each is rounded to for display.
+ROI_COLUMNS = ('admission', 'avg wins', 'avg gems', 'avg packs',
+               'rares', 'value', 'profit', 'roi ratio')
+ROI_DIGITS = (None, 1, None, 1, None, None, None, 2)
 
 class Event:
     """Base class for event classes.
 
     Subclasses define
-        - gem_rewards: list of gem reward amounts by games won
+        - gem_rewards: array of gem reward amounts by games won
         - admission: price in gems for the event
-        - pack_rewards: list of pack reward amounts by games won
+        - pack_rewards: array of pack reward amounts by games won
 
     Subclasses also define either `wincount_probs` and `maxwins` or `wincount_odds`.
         - wincount_probs: binomial function used by default `wincount_odds`
         - maxwins: the maximum number of wins for the event
-        - wincount_odds(winrate): returns list of odds of winning n games
+        - wincount_odds(winrate): returns array of odds of winning n games
+
+    Subclasses may also name compiled kernels that stand in for `wincount_odds`:
+        - reward_average(winrate, rewards): average of `rewards` at a float
+          winrate, used by `avg_gems`
+        - roi_average(winrate, gem_rewards, pack_rewards): average gems, packs
+          and wins at a float winrate in one pass, used by `roi`
+        - reward_sweep and roi_sweep: their counterparts for a 1-D array of
+          winrates, used for arrays and by `roi_table`
     """
     rares = 3  # assume that an average of 3 rares are drafted
+    reward_average = None
+    reward_sweep = None
+    roi_average = None
+    roi_sweep = None
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Rows: gems, packs and wins for each win count, for events without kernels.
+        cls._reward_matrix = np.vstack([cls.gem_rewards, cls.pack_rewards,
+                                        np.arange(len(cls.gem_rewards))])
 
     @classmethod
     def weighted_rewards(cls, reward_scheme, winrate):
-        return [odds * rewards
-                for odds, rewards in zip(cls.wincount_odds(winrate), reward_scheme)]
+        return cls.wincount_odds(winrate) * reward_scheme
 
     @classmethod
+    @_cache_scalar_winrates()
     def avg_gems(cls, winrate):
-        """Average gem rewards per event."""
-        return sum(cls.weighted_rewards(cls.gem_rewards, winrate))
+        """Average gem rewards per event.
+
+        `winrate` may also be an array, giving an array of averages.
+        """
+        if cls.reward_average is not None:
+            return _sweep(cls.reward_average, cls.reward_sweep, winrate, cls.gem_rewards)
+        if np.ndim(winrate):
+            return (cls.wincount_odds(winrate) * cls.gem_rewards).sum(axis=-1)
+        return fsum(map(mul, cls.wincount_odds(winrate), cls.gem_rewards))
 
     @classmethod
     def roi(cls, winrate):
@@ -94,29 +447,75 @@ class Event:
 
         Admission prices are in gems.
         """
-        average_wins = sum(wincount * p
-                           for wincount, p in zip(range(8), cls.wincount_odds(winrate)))
-        gems = cls.avg_gems(winrate)
-        packs = sum(cls.weighted_rewards(cls.pack_rewards, winrate))
+        if cls.roi_average is not None:
+            gems, packs, average_wins = map(float, cls.roi_average(
+                float(winrate), cls.gem_rewards, cls.pack_rewards))
+        else:
+            odds = cls.wincount_odds(winrate)
+            gems, packs, average_wins = (fsum(map(mul, odds, rewards))
+                                         for rewards in cls._reward_matrix)
+        # Python floats throughout, computed as `_roi_table` computes its columns.
         reward = gems + 200*(packs + cls.rares)
-        return {'admission': cls.admission,
-                'avg wins': round(average_wins, ndigits=1),
-                'avg gems': round(gems),
-                'avg packs': round(packs, ndigits=1),
-                'rares': cls.rares,
-                'value': round(reward),
-                'profit': round(reward - cls.admission),
-                'roi ratio': round(float(reward) / cls.admission, ndigits=2),
-                }
+        return dict(zip(ROI_COLUMNS, (cls.admission,
+                                      round(average_wins, 1),
+                                      round(gems),
+                                      round(packs, 1),
+                                      cls.rares,
+                                      round(reward),
+                                      round(reward - cls.admission),
+                                      round(reward / cls.admission, 2))))
 
     @classmethod
-    def wincount_odds(cls, winrate):
-        return [cls.wincount_probs(winrate, numwins)
-                for numwins in range(cls.maxwins+1)]
+    def roi_table(cls, winrates):
+        """Unrounded `roi` figures for each of `winrates`, one row per winrate.
+
+        Columns are as listed in `ROI_COLUMNS`.
+        """
+        winrates = np.asarray(winrates, dtype=np.float64).reshape(-1)
+        if cls.roi_sweep is not None:
+            averages = cls.roi_sweep(winrates, cls.gem_rewards, cls.pack_rewards)
+        else:
+            # Summed the way `avg_gems` sums arrays, rather than by a BLAS matmul,
+            # which reorders the additions.
+            odds = cls.wincount_odds(winrates)
+            averages = (cls._reward_matrix * odds[:, None, :]).sum(axis=-1).T
+        return cls._roi_table(*averages)
+
+    @classmethod
+    def _roi_table(cls, gems, packs, average_wins):
+        # Batches only; `roi` builds its single row from Python floats.
+        reward = gems + 200*(packs + cls.rares)
+        table = np.empty((len(gems), len(ROI_COLUMNS)))
+        table[:, 0] = cls.admission
+        table[:, 1] = average_wins
+        table[:, 2] = gems
+        table[:, 3] = packs
+        table[:, 4] = cls.rares
+        table[:, 5] = reward
+        table[:, 6] = reward - cls.admission
+        table[:, 7] = reward / cls.admission
+        return table
 
+    @classmethod
+    def wincount_odds(cls, winrate):
+        winrate = np.asarray(winrate, dtype=np.float64)
+        count = cls.maxwins+1
+        odds = np.fromiter((cls.wincount_probs(w, numwins)
+                            for w in winrate.flat for numwins in range(count)),
+                           dtype=np.float64, count=winrate.size*count)
+        return odds.reshape(winrate.shape + (count,))
+
+_GEM_SEALED = np.array([200, 400, 600, 1200, 1400, 1600, 2000, 2200], dtype=np.float64)
+_GEM_TRAD_SEALED = np.array([200, 500, 1200, 1800, 2200], dtype=np.float64)
+# Traditional Sealed's average gems, expanded once into a polynomial in the winrate.
+_GEM_TRAD_SEALED_POLY = _GEM_TRAD_SEALED @ lose2_odds_polys(4)
+
+@_cache_scalar_winrates()
 def gems_per_sealed(winrate):
     """Calculates average gems per Sealed Draft for a given winrate.
 
+    `winrate` may also be an array, giving an array of averages.
+
     >>> pprint([(winrate, round(gems_per_sealed(winrate)))
     ...         for winrate in (r/100 for r in range(30, 100, 5))])
     [(0.3, 524),
@@ -137,16 +536,19 @@ def gems_per_sealed(winrate):
     Win rate needed to break even at Sealed is 81.01%
     >>> round(gems_per_sealed(0.8101))
     2000
+    >>> gems_per_sealed(np.array([0.5, 0.8101])).round()
+    array([1002., 2000.])
+    >>> round(gems_per_sealed(np.array(0.5)))
+    1002
     """
-    wincount_odds = [cf_record_prob_lose3(winrate, numwins) for numwins in range(8)]
-    gem_rewards = [200, 400, 600, 1200, 1400, 1600, 2000, 2200]
-    weighted_rewards = [odds * rewards for odds, rewards in zip(wincount_odds, gem_rewards)]
-    return sum(weighted_rewards)
+    return _sweep(_average_lose3, _sweep_lose3, winrate, _GEM_SEALED)
 
+@_cache_scalar_winrates()
 def gems_per_trad_sealed(winrate):
     """Average gems per Traditional Sealed event.
 
     Note that this uses winrate per match, rather than per game.
+    `winrate` may also be an array, as for `gems_per_sealed`.
 
     >>> pprint([(winrate, round(gems_per_trad_sealed(winrate)))
     ...         for winrate in (r/100 for r in range(30, 100, 5))])
@@ -169,10 +571,7 @@ def gems_per_trad_sealed(winrate):
     >>> round(gems_per_trad_sealed(0.8412))
     2000
     """
-    wincount_odds = [cf_record_prob_lose2(winrate, numwins, maxwins=4) for numwins in range(5)]
-    gem_rewards = [200, 500, 1200, 1800, 2200]
-    weighted_rewards = [odds * rewards for odds, rewards in zip(wincount_odds, gem_rewards)]
-    return sum(weighted_rewards)
+    return _sweep(_horner, _sweep_horner, winrate, _GEM_TRAD_SEALED_POLY)
 
 class QuickDraft(Event):
     """Analysis of Quick Draft events.
@@ -235,11 +634,19 @@ class QuickDraft(Event):
     0.95          750         7           947          2          3     1945      1195         2.59
     1             750         7           950          2          3     1950      1200         2.6
     """
-    gem_rewards = [50, 100, 200, 300, 450, 650, 850, 950]
+    gem_rewards = np.array([50, 100, 200, 300, 450, 650, 850, 950], dtype=np.float64)
     admission = 750  #admission price in gems
-    pack_rewards = [1, 1, 1, 1, 1, 1, 1, 2]
-    wincount_probs = cf_record_prob_lose3
+    pack_rewards = np.array([1, 1, 1, 1, 1, 1, 1, 2], dtype=np.float64)
+    wincount_odds = lose3_odds
     maxwins = 7
+    reward_average = staticmethod(_average_lose3)
+    reward_sweep = staticmethod(_sweep_lose3)
+    roi_average = staticmethod(_roi_lose3)
+    roi_sweep = staticmethod(_sweep_roi_lose3)
+
+# Number of win/loss orderings for each win count over three matches.
+_TRAD_DRAFT_CASES = np.array([1, 3, 3, 1])
+_TRAD_DRAFT_WINS = np.arange(4)
 
 class TradDraft(Event):
     """Analysis of Traditional Draft events.
@@ -289,9 +696,9 @@ class TradDraft(Event):
     1            1500         3          3000          6          3     4800      3300         3.2
 
     """
-    gem_rewards = [0, 0, 1000, 3000]
+    gem_rewards = np.array([0, 0, 1000, 3000], dtype=np.float64)
     admission = 1500
-    pack_rewards = [1, 1, 4, 6]
+    pack_rewards = np.array([1, 1, 4, 6], dtype=np.float64)
     def wincount_odds(winrate):
         """Calculate odds of winning n games for each possible value of n.
 
@@ -304,9 +711,13 @@ class TradDraft(Event):
           - 2 wins: WWL, WLW, LWW
           - 3 wins: WWW
         """
-        case_counts = [1, 3, 3, 1]
-        return [cc*pow(1-winrate, 3-wincount)*pow(winrate, wincount)
-                for cc, wincount in zip(case_counts, range(4))]
+        winrate = np.asarray(winrate, dtype=np.float64)[..., None]
+        return (_TRAD_DRAFT_CASES * (1-winrate)**(3-_TRAD_DRAFT_WINS)
+                * winrate**_TRAD_DRAFT_WINS)
+    reward_average = staticmethod(_average_trad_draft)
+    reward_sweep = staticmethod(_sweep_trad_draft)
+    roi_average = staticmethod(_roi_trad_draft)
+    roi_sweep = staticmethod(_sweep_roi_trad_draft)
 
 class PremierDraft(Event):
     """Analysis of Premier Draft events.
@@ -353,8 +764,56 @@ class PremierDraft(Event):
     0.95         1500         7          2193          6          3     3989      2489         2.66
     1            1500         7          2200          6          3     4000      2500         2.67
     """
-    gem_rewards = [50, 100, 250, 1000, 1400, 1600, 1800, 2200]
-    wincount_probs = cf_record_prob_lose3
+    gem_rewards = np.array([50, 100, 250, 1000, 1400, 1600, 1800, 2200], dtype=np.float64)
+    wincount_odds = lose3_odds
     maxwins = 7
+    reward_average = staticmethod(_average_lose3)
+    reward_sweep = staticmethod(_sweep_lose3)
+    roi_average = staticmethod(_roi_lose3)
+    roi_sweep = staticmethod(_sweep_roi_lose3)
     admission = 1500
-    pack_rewards = [1, 1, 2, 2, 3, 4, 5, 6]
+    pack_rewards = np.array([1, 1, 2, 2, 3, 4, 5, 6], dtype=np.float64)
+
+# Module-level names for the draft averages, to match `gems_per_sealed` and
+# `gems_per_trad_sealed`.
+gems_per_quick_draft = QuickDraft.avg_gems
+gems_per_trad_draft = TradDraft.avg_gems
+gems_per_premier_draft = PremierDraft.avg_gems
+
+# Event ids for `gems_per_event`, indexing `_GEM_EVALUATORS`.
+SEALED, QUICK_DRAFT, PREMIER_DRAFT, TRAD_SEALED, TRAD_DRAFT = range(5)
+
+# (scalar kernel, array sweep, kernel arguments) for each event id: the same
+# evaluators the per-event functions use, so that the results are identical.
+_GEM_EVALUATORS = (
+    (_average_lose3, _sweep_lose3, (_GEM_SEALED,)),
+    (QuickDraft.reward_average, QuickDraft.reward_sweep, (QuickDraft.gem_rewards,)),
+    (PremierDraft.reward_average, PremierDraft.reward_sweep, (PremierDraft.gem_rewards,)),
+    (_horner, _sweep_horner, (_GEM_TRAD_SEALED_POLY,)),
+    (TradDraft.reward_average, TradDraft.reward_sweep, (TradDraft.gem_rewards,)),
+)
+
+def gems_per_event(event_id, winrate):
+    """Average gem rewards for the event `event_id` at `winrate`.
+
+    `winrate` may also be an array.  The event's kernel is called directly,
+    without the per-event functions' caches in between.
+
+    >>> [round(gems_per_event(event_id, 0.95)) for event_id in range(5)]
+    [2194, 947, 2193, 2177, 2707]
+    >>> gems_per_event(TRAD_DRAFT, 0.95) == gems_per_trad_draft(0.95)
+    True
+    >>> gems_per_event(-1, 0.5)
+    Traceback (most recent call last):
+    ...
+    ValueError: unknown event id -1
+    >>> gems_per_event(1.5, 0.5)
+    Traceback (most recent call last):
+    ...
+    ValueError: unknown event id 1.5
+    """
+    if (not isinstance(event_id, (int, np.integer))
+            or not 0 <= event_id < len(_GEM_EVALUATORS)):
+        raise ValueError(f"unknown event id {event_id!r}")
+    average, sweep, args = _GEM_EVALUATORS[event_id]
+    return _sweep(average, sweep, winrate, *args)